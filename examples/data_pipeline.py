@@ -17,15 +17,29 @@ from infrar.storage import upload, download, list_objects
 
 
 def process_data(input_file: str, output_file: str) -> None:
-    """Process CSV data - example transformation."""
-    # Read input
-    with open(input_file, "r") as f:
-        reader = csv.DictReader(f)
-        data = list(reader)
+    """
+    Process CSV data - example transformation.
+
+    Rows are read with csv.reader and accessed by column index (look indexes up
+    once with header.index("name")), which avoids building a dict per row as
+    csv.DictReader does. For heavy numeric work, a vectorized parser such as
+    pyarrow.csv.read_csv(input_file) is typically an order of magnitude faster
+    than the stdlib csv module.
+    """
+    # Read input, streaming rows so memory use doesn't grow with file size
+    total_records = 0
+    with open(input_file, "r", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is not None:
+            for row in reader:
+                # Blank lines parse as [], which DictReader skipped; do the same
+                if row:
+                    total_records += 1
 
     # Process (example: calculate summary)
     processed = {
-        "total_records": len(data),
+        "total_records": total_records,
         "summary": "Data processed successfully",
     }
 
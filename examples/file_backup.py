@@ -10,29 +10,77 @@ This example shows how to create a simple backup system that:
 Deploy this to AWS, GCP, or Azure - same code works everywhere!
 """
 
-from datetime import datetime
+import asyncio
+import hashlib
+import heapq
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from infrar.storage import upload, delete, list_objects
+from infrar.storage import MAX_CONCURRENCY, aio
+from infrar.storage import upload_many, delete_many, iter_objects, list_objects
+
+log = logging.getLogger(__name__)
+
+
+def backup_key(timestamp: str, file_path: str) -> str:
+    """Build the sharded backup key: backups/SHARD/TIMESTAMP/NAME."""
+    name = Path(file_path).name
+    # A leading hash shard spreads writes across storage partitions instead of
+    # funnelling every upload through the single, ever-increasing timestamp prefix.
+    # The hash must be stable across runs, so builtin hash() (randomized per
+    # process by PYTHONHASHSEED) can't be used.
+    shard = hashlib.blake2b(name.encode(), digest_size=1).hexdigest()
+    return f"backups/{shard}/{timestamp}/{name}"
+
+
+def existing_files(files_to_backup: list[str]) -> list[str]:
+    """Return the files that exist, warning about the rest."""
+    # Check up front rather than letting a batch fail part-way: one stat per
+    # file is far cheaper than transferring the batch again
+    found: list[str] = []
+    for file_path in files_to_backup:
+        if os.path.isfile(file_path):
+            found.append(file_path)
+        else:
+            log.warning("⚠️  Skipping %s (not found)", file_path)
+    return found
 
 
 def backup_files(files_to_backup: list[str], bucket: str) -> None:
     """Backup multiple files to cloud storage."""
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    # Fixed-width nanoseconds since the epoch: sorts correctly as text and as int
+    timestamp = f"{time.time_ns():020d}"
 
-    print(f"🔄 Starting backup at {timestamp}...")
+    log.info("🔄 Starting backup at %s...", timestamp)
 
-    for file_path in files_to_backup:
-        file = Path(file_path)
-        if not file.exists():
-            print(f"⚠️  Skipping {file_path} (not found)")
-            continue
+    items = [
+        (file_path, backup_key(timestamp, file_path))
+        for file_path in existing_files(files_to_backup)
+    ]
+
+    # Upload all files in one batched, concurrent transfer
+    upload_many(bucket=bucket, items=items)
+
+    for file_path, backup_path in items:
+        log.info("✅ Backed up: %s → %s", file_path, backup_path)
 
-        # Create timestamped backup path
-        backup_path = f"backups/{timestamp}/{file.name}"
 
-        upload(bucket=bucket, source=file_path, destination=backup_path)
+async def backup_files_async(files_to_backup: list[str], bucket: str) -> None:
+    """Backup multiple files from inside an asyncio event loop."""
+    timestamp = f"{time.time_ns():020d}"
+    limit = asyncio.Semaphore(MAX_CONCURRENCY)
 
-        print(f"✅ Backed up: {file.name} → {backup_path}")
+    async def backup_one(file_path: str) -> None:
+        backup_path = backup_key(timestamp, file_path)
+        async with limit:
+            await aio.upload(bucket=bucket, source=file_path, destination=backup_path)
+        log.info("✅ Backed up: %s → %s", file_path, backup_path)
+
+    await asyncio.gather(*(backup_one(file_path) for file_path in existing_files(files_to_backup)))
 
 
 def list_backups(bucket: str) -> list[str]:
@@ -42,31 +90,49 @@ def list_backups(bucket: str) -> list[str]:
 
 
 def cleanup_old_backups(bucket: str, keep_latest: int = 5) -> None:
-    """Delete old backups, keeping only the latest N."""
-    all_backups = list_backups(bucket)
-
-    # Group by timestamp (assuming format: backups/TIMESTAMP/file.ext)
-    timestamps = set()
-    for backup in all_backups:
-        parts = backup.split("/")
-        if len(parts) >= 2:
-            timestamps.add(parts[1])
-
-    # Sort and identify old backups to delete
-    sorted_timestamps = sorted(timestamps, reverse=True)
-    if len(sorted_timestamps) <= keep_latest:
-        print(f"📦 Only {len(sorted_timestamps)} backup(s) exist, nothing to clean up")
+    """
+    Delete old backups, keeping only the latest N.
+
+    Only backups in the current backups/SHARD/TIMESTAMP/ layout are considered.
+    Backups written by older versions of this example (backups/YYYYmmdd-HHMMSS/)
+    are never deleted automatically; a warning lists them so they can be reviewed
+    and removed by hand, e.g. with delete_many(bucket, iter_objects(bucket, prefix)).
+    """
+    # List only the backups/SHARD/TIMESTAMP/ prefixes, not every backed up object
+    backup_prefixes: dict[str, list[str]] = {}
+    for shard_prefix in iter_objects(bucket=bucket, prefix="backups/", delimiter="/"):
+        shard = shard_prefix[len("backups/") : -1]
+        if len(shard) != 2:
+            log.warning("⚠️  Skipping %s (old backup layout, remove manually)", shard_prefix)
+            continue
+        for backup_prefix in iter_objects(bucket=bucket, prefix=shard_prefix, delimiter="/"):
+            timestamp = backup_prefix[len(shard_prefix) : -1]
+            if not timestamp.isdigit():
+                log.warning("⚠️  Skipping %s (unrecognized timestamp)", backup_prefix)
+                continue
+            backup_prefixes.setdefault(timestamp, []).append(backup_prefix)
+    timestamps = list(backup_prefixes)
+
+    # Identify old backups to delete, without sorting every timestamp
+    if len(timestamps) <= keep_latest:
+        log.info("📦 Only %s backup(s) exist, nothing to clean up", len(timestamps))
         return
 
-    old_timestamps = sorted_timestamps[keep_latest:]
+    latest = set(heapq.nlargest(keep_latest, timestamps, key=int))
+    old_timestamps = [ts for ts in timestamps if ts not in latest]
+
+    log.info("🗑️  Cleaning up %s old backup(s)...", len(old_timestamps))
 
-    print(f"🗑️  Cleaning up {len(old_timestamps)} old backup(s)...")
+    # List each old backup by its own prefix so matching happens server-side
+    stale: list[str] = []
+    for old_ts in old_timestamps:
+        for backup_prefix in backup_prefixes[old_ts]:
+            stale.extend(iter_objects(bucket=bucket, prefix=backup_prefix))
 
-    for backup in all_backups:
-        for old_ts in old_timestamps:
-            if f"backups/{old_ts}/" in backup:
-                delete(bucket=bucket, path=backup)
-                print(f"  Deleted: {backup}")
+    # Delete everything in batched requests instead of one call per object
+    delete_many(bucket=bucket, paths=stale)
+    for backup in stale:
+        log.info("  Deleted: %s", backup)
 
 
 def main():
@@ -80,24 +146,36 @@ def main():
         "/data/important-data.csv",
     ]
 
-    # Perform backup
-    backup_files(files, bucket)
+    # Perform backup, from an event loop with --async
+    if "--async" in sys.argv[1:]:
+        asyncio.run(backup_files_async(files, bucket))
+    else:
+        backup_files(files, bucket)
 
     # List all backups
-    print("\n📋 Current backups:")
+    log.info("📋 Current backups:")
     backups = list_backups(bucket)
     for backup in backups[:10]:  # Show first 10
-        print(f"  - {backup}")
+        log.info("  - %s", backup)
 
     if len(backups) > 10:
-        print(f"  ... and {len(backups) - 10} more")
+        log.info("  ... and %s more", len(backups) - 10)
 
     # Cleanup old backups
-    print()
     cleanup_old_backups(bucket, keep_latest=5)
 
-    print("\n✅ Backup completed!")
+    log.info("✅ Backup completed!")
 
 
 if __name__ == "__main__":
-    main()
+    # Hand log records to a background thread so callers never block on stdout
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
+    listener.start()
+    try:
+        main()
+    finally:
+        listener.stop()
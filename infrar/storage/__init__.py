@@ -14,6 +14,11 @@ Operations:
     - download: Download a file from object storage
     - delete: Delete an object from storage
     - list_objects: List objects in a bucket with optional prefix
+    - iter_objects: Stream objects in a bucket with optional prefix
+    - upload_many: Upload several files concurrently
+    - download_many: Download several objects concurrently
+    - delete_many: Delete several objects in batched requests
+    - copy: Copy an object within or between buckets, server-side
 
 Example:
     >>> from infrar.storage import upload, download, list_objects
@@ -31,11 +36,69 @@ Example:
 Note:
     These functions are stubs that are transformed away at deployment time.
     The actual implementation depends on your target cloud provider.
+
+    Coroutine versions of these operations, for use inside an asyncio event loop,
+    are available in infrar.storage.aio.
+
+Transformer Contract:
+    Generated code must create the provider client once per process and reuse it
+    for every call, never construct it per operation. Client construction resolves
+    credentials, loads service models and opens a fresh connection pool, so doing
+    it per call adds tens to hundreds of milliseconds and a new TLS handshake:
+
+        _REGION = 'eu-west-1'  # resolved at deployment time
+        _s3 = None
+
+        def _client():
+            global _s3
+            if _s3 is None:
+                _s3 = boto3.client('s3', region_name=_REGION, config=Config(
+                    max_pool_connections=64,
+                    retries={'max_attempts': 10, 'mode': 'adaptive'},
+                ))
+            return _s3
+
+    Each lowered operation starts with `s3 = _client()`. The pool size must be at
+    least MAX_CONCURRENCY, otherwise concurrent transfers queue on the pool. GCP and
+    Azure follow the same pattern with storage.Client() and BlobServiceClient().
+
+    The target provider, region and endpoint are known at deployment time, so the
+    transformer writes them into the generated module as constants. Nothing is
+    discovered at runtime: no provider probing and no region lookup. This matters
+    most for short-lived functions, where the first storage call would otherwise
+    pay for the lookups. Credentials are the exception. They are never written
+    into generated code; they come from the deployment environment (environment
+    variables or the platform's role), which the provider SDK checks first.
 """
 
-from typing import List, Optional
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from infrar.storage import _local
+
+__all__ = [
+    "upload",
+    "download",
+    "delete",
+    "list_objects",
+    "iter_objects",
+    "upload_many",
+    "download_many",
+    "delete_many",
+    "copy",
+]
+
+# Transfer tuning knobs read by the transformer when lowering upload/download.
+# Files larger than MULTIPART_THRESHOLD are transferred in MULTIPART_CHUNKSIZE parts
+# (multipart upload / byte-range GETs), with up to MAX_CONCURRENCY parts in flight.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MAX_CONCURRENCY = 16
+
 
-__all__ = ["upload", "download", "delete", "list_objects"]
+def _use_local() -> bool:
+    """Whether calls should be served by the local filesystem backend."""
+    return os.environ.get("INFRAR_PROVIDER") == "local"
 
 
 def upload(bucket: str, source: str, destination: str) -> None:
@@ -67,13 +130,66 @@ def upload(bucket: str, source: str, destination: str) -> None:
         ...     destination='reports/2024-10/report.csv'
         ... )
 
+    Large Files:
+        Files larger than MULTIPART_THRESHOLD are sent as a multipart upload of
+        MULTIPART_CHUNKSIZE parts, with up to MAX_CONCURRENCY parts uploaded in
+        parallel. A single PUT is capped at 5 GB and limited to one TCP stream's
+        throughput; parallel parts are not.
+            - AWS: upload_file(..., Config=TransferConfig(multipart_threshold=...,
+              multipart_chunksize=..., max_concurrency=..., use_threads=True))
+            - GCP: transfer_manager.upload_chunks_concurrently()
+
+    Key Design:
+        Keys that share a monotonically increasing prefix (e.g. 'backups/<timestamp>/')
+        all land on the same storage partition, capping throughput at that partition's
+        request limit (about 3,500 PUT/s on S3). For high write rates, lead with a
+        short hash shard such as 'backups/<shard>/<timestamp>/<name>', so writes
+        spread across up to as many partitions as there are shards. The shard
+        must be derived deterministically from the key (e.g. hashlib.blake2b or
+        zlib.crc32 of the name), never from builtin hash(), which changes between
+        interpreter runs and would scatter the same name across shards.
+
+    Transformer Contract:
+        When emitting explicit multipart code, parts must be scheduled with a
+        sliding window: start MAX_CONCURRENCY part uploads, then submit the next
+        part as soon as any in-flight part completes. Never wait for a whole batch
+        of parts to finish before starting the next one; a single slow part would
+        leave the other connections idle.
+
+            parts = iter(parts)
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as pool:
+                futures = {pool.submit(upload_part, p) for p in islice(parts, MAX_CONCURRENCY)}
+                while futures:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        fut.result()
+                        futures.update(pool.submit(upload_part, p) for p in islice(parts, 1))
+
+        The pattern `for batch in chunks(parts, N): wait(batch)` is forbidden.
+
+        Retries apply per part, never to the whole file: a transient failure
+        (500, 503, SlowDown) re-sends only that part under the same UploadId,
+        with exponential backoff and jitter, up to 10 attempts. The client is
+        configured with retries={'max_attempts': 10, 'mode': 'adaptive'}. If the
+        upload cannot complete, the generated code must abort it so orphaned parts
+        don't accumulate storage charges:
+
+            upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key)['UploadId']
+            try:
+                ...  # sliding-window upload_part calls, each retried on its own
+                s3.complete_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id, ...)
+            except BaseException:
+                s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+                raise
+
     Note:
         In production, this function is completely replaced by provider-specific code.
         No runtime overhead exists.
     """
     # This is a stub that will be transformed away at deployment time
-    # For local development, you can optionally implement actual cloud SDK calls
-    # or use a mock implementation
+    # For local development, INFRAR_PROVIDER=local serves it from the filesystem
+    if _use_local():
+        return _local.upload(bucket, source, destination)
     raise NotImplementedError(
         "This function is transformed at deployment time. "
         "For local development, set INFRAR_PROVIDER environment variable "
@@ -110,10 +226,20 @@ def download(bucket: str, source: str, destination: str) -> None:
         ...     destination='/tmp/downloaded-report.csv'
         ... )
 
+    Large Files:
+        Objects larger than MULTIPART_THRESHOLD are fetched as concurrent
+        byte-range GETs of MULTIPART_CHUNKSIZE bytes, with up to MAX_CONCURRENCY
+        ranges in flight.
+            - AWS: download_file(..., Config=TransferConfig(multipart_threshold=...,
+              multipart_chunksize=..., max_concurrency=..., use_threads=True))
+            - GCP: transfer_manager.download_chunks_concurrently()
+
     Note:
         The destination directory must exist. The function will overwrite
         existing files without warning.
     """
+    if _use_local():
+        return _local.download(bucket, source, destination)
     raise NotImplementedError(
         "This function is transformed at deployment time. "
         "For local development, set INFRAR_PROVIDER environment variable "
@@ -151,6 +277,8 @@ def delete(bucket: str, path: str) -> None:
         This operation is idempotent - deleting a non-existent object
         typically doesn't raise an error on most cloud providers.
     """
+    if _use_local():
+        return _local.delete(bucket, path)
     raise NotImplementedError(
         "This function is transformed at deployment time. "
         "For local development, set INFRAR_PROVIDER environment variable "
@@ -158,22 +286,30 @@ def delete(bucket: str, path: str) -> None:
     )
 
 
-def list_objects(bucket: str, prefix: str = "") -> List[str]:
+def list_objects(bucket: str, prefix: str = "", delimiter: Optional[str] = None) -> List[str]:
     """
     List objects in a bucket, optionally filtered by prefix.
 
+    Deprecated:
+        Prefer iter_objects(), which streams keys instead of materializing the
+        whole listing in memory. list_objects() is kept for compatibility and is
+        equivalent to list(iter_objects(bucket, prefix, delimiter)).
+
     This function is transformed at deployment time to use the native SDK of your
     target cloud provider:
-        - AWS: boto3.client('s3').list_objects_v2()
+        - AWS: boto3.client('s3').get_paginator('list_objects_v2')
         - GCP: storage.Client().list_blobs()
         - Azure: ContainerClient().list_blobs()
 
     Args:
         bucket: Name of the storage bucket
         prefix: Optional prefix to filter objects (e.g., 'reports/2024/')
+        delimiter: Optional delimiter (usually '/'). When set, only the distinct
+            "directory" prefixes directly below prefix are returned, not objects
 
     Returns:
-        List of object keys/paths in the bucket
+        List of object keys/paths in the bucket, or of common prefixes if
+        delimiter is set
 
     Raises:
         PermissionError: If insufficient permissions (in local dev mode)
@@ -190,9 +326,265 @@ def list_objects(bucket: str, prefix: str = "") -> List[str]:
         ['reports/report1.csv', 'reports/report2.csv']
 
     Note:
-        Large buckets may return thousands of objects. Consider using
-        pagination or more specific prefixes in production.
+        Large buckets may return millions of objects, all of which are held in
+        memory. Use iter_objects() or more specific prefixes in production.
+    """
+    return list(iter_objects(bucket=bucket, prefix=prefix, delimiter=delimiter))
+
+
+def iter_objects(bucket: str, prefix: str = "", delimiter: Optional[str] = None) -> Iterator[str]:
+    """
+    Iterate over objects in a bucket, optionally filtered by prefix.
+
+    Keys are yielded page by page as the listing is fetched, so memory use stays
+    constant regardless of bucket size and callers can stop early. Every page of
+    the listing is followed; results are never truncated at the provider's
+    per-request limit (1000 keys on S3).
+
+    This function is transformed at deployment time to use the native SDK of your
+    target cloud provider:
+        - AWS: boto3.client('s3').get_paginator('list_objects_v2').paginate()
+          (reading page['CommonPrefixes'] when delimiter is set)
+        - GCP: storage.Client().list_blobs() (already a lazy iterator; its
+          .prefixes when delimiter is set)
+        - Azure: ContainerClient().list_blobs(), or walk_blobs() when delimiter is set
+
+    Args:
+        bucket: Name of the storage bucket
+        prefix: Optional prefix to filter objects (e.g., 'reports/2024/')
+        delimiter: Optional delimiter (usually '/'). When set, only the distinct
+            "directory" prefixes directly below prefix are yielded, not objects
+
+    Returns:
+        Iterator over object keys/paths in the bucket, or over common prefixes
+        if delimiter is set
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> for key in iter_objects(bucket='my-data', prefix='reports/'):
+        ...     print(key)
+        reports/report1.csv
+        reports/report2.csv
+        >>>
+        >>> # List "directories" only, without listing the objects inside them
+        >>> list(iter_objects(bucket='my-data', prefix='reports/', delimiter='/'))
+        ['reports/2023/', 'reports/2024/']
+
+    Note:
+        Listing with a delimiter lets the provider collapse every object under a
+        prefix into one entry, which is far cheaper than listing all objects and
+        splitting keys client-side.
+
+    Transformer Contract:
+        Listing must always be paginated. A single list_objects_v2() call stops at
+        1000 keys and silently drops the rest, so generated code must never read
+        response['Contents'] from one call. Reference AWS lowering:
+
+            paginator = s3.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
+                Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000}
+            )
+            for page in pages:
+                yield from (obj['Key'] for obj in page.get('Contents', []))
+
+        With a delimiter, also pass Delimiter=delimiter and yield cp['Prefix'] for
+        each entry of page.get('CommonPrefixes', []). GCP's list_blobs() and
+        Azure's list_blobs() already paginate lazily and are iterated directly.
+        The same contract applies to list_objects().
+    """
+    if _use_local():
+        return _local.iter_objects(bucket, prefix, delimiter)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+def upload_many(
+    bucket: str, items: List[Tuple[str, str]], max_concurrency: int = MAX_CONCURRENCY
+) -> None:
+    """
+    Upload several files to object storage concurrently.
+
+    Prefer this over calling upload() in a loop: each sequential call pays a full
+    HTTPS round-trip, while a batched transfer reuses connections and keeps up to
+    max_concurrency requests in flight.
+
+    This function is transformed at deployment time to use the native SDK of your
+    target cloud provider:
+        - AWS: concurrent.futures.ThreadPoolExecutor over boto3.client('s3').upload_file()
+        - GCP: google.cloud.storage.transfer_manager.upload_many()
+        - Azure: asyncio.gather() over BlobClient().upload_blob()
+
+    Args:
+        bucket: Name of the storage bucket
+        items: List of (source, destination) pairs, where source is a local file
+            path and destination is the path/key in the bucket
+        max_concurrency: Maximum number of transfers in flight at once
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If a source file doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> upload_many(
+        ...     bucket='analytics-data',
+        ...     items=[
+        ...         ('/tmp/report.csv', 'reports/2024-10/report.csv'),
+        ...         ('/tmp/summary.csv', 'reports/2024-10/summary.csv'),
+        ...     ]
+        ... )
+
+    Note:
+        Going beyond 16 concurrent transfers rarely helps: a single host's network
+        bandwidth is usually saturated well before that.
+    """
+    if _use_local():
+        return _local.upload_many(bucket, items, max_concurrency)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+def download_many(
+    bucket: str, items: List[Tuple[str, str]], max_concurrency: int = MAX_CONCURRENCY
+) -> None:
+    """
+    Download several objects from object storage concurrently.
+
+    This function is transformed at deployment time to use the native SDK of your
+    target cloud provider:
+        - AWS: concurrent.futures.ThreadPoolExecutor over boto3.client('s3').download_file()
+        - GCP: google.cloud.storage.transfer_manager.download_many()
+        - Azure: asyncio.gather() over BlobClient().download_blob()
+
+    Args:
+        bucket: Name of the storage bucket
+        items: List of (source, destination) pairs, where source is the object
+            key/path in the bucket and destination is a local file path
+        max_concurrency: Maximum number of transfers in flight at once
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If an object doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> download_many(
+        ...     bucket='analytics-data',
+        ...     items=[
+        ...         ('reports/2024-10/report.csv', '/tmp/report.csv'),
+        ...         ('reports/2024-10/summary.csv', '/tmp/summary.csv'),
+        ...     ]
+        ... )
+
+    Note:
+        Destination directories must exist. Existing files are overwritten
+        without warning.
+    """
+    if _use_local():
+        return _local.download_many(bucket, items, max_concurrency)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+def delete_many(bucket: str, paths: Iterable[str]) -> None:
+    """
+    Delete several objects from storage in batched requests.
+
+    Prefer this over calling delete() in a loop: keys are grouped into a single
+    request per batch instead of one round-trip per object.
+
+    This function is transformed at deployment time to use the native SDK of your
+    target cloud provider:
+        - AWS: boto3.client('s3').delete_objects() in batches of up to 1000 keys
+        - GCP: storage.Client().bucket().delete_blobs() in batches of up to 100 blobs
+        - Azure: ContainerClient().delete_blobs() in batches of up to 256 blobs
+
+    Args:
+        bucket: Name of the storage bucket
+        paths: Object keys/paths to delete. May be any iterable, including the
+            iterator returned by iter_objects()
+
+    Returns:
+        None
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> delete_many(
+        ...     bucket='temporary-data',
+        ...     paths=iter_objects(bucket='temporary-data', prefix='temp/')
+        ... )
+
+    Note:
+        Like delete(), this operation is idempotent - keys that don't exist are
+        ignored rather than reported as errors.
+    """
+    if _use_local():
+        return _local.delete_many(bucket, paths)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+def copy(bucket: str, source: str, destination: str, source_bucket: Optional[str] = None) -> None:
+    """
+    Copy an object within storage, without downloading it.
+
+    The copy is performed server-side: object data never passes through the
+    machine running this code. Prefer this over download() followed by upload()
+    when moving or promoting objects.
+
+    This function is transformed at deployment time to use the native SDK of your
+    target cloud provider:
+        - AWS: boto3.client('s3').copy() with TransferConfig(multipart_threshold=...,
+          multipart_chunksize=..., max_concurrency=...), which uses UploadPartCopy
+          for objects larger than MULTIPART_THRESHOLD
+        - GCP: storage.Client().bucket().copy_blob()
+        - Azure: BlobServiceClient().get_blob_client().start_copy_from_url()
+
+    Args:
+        bucket: Name of the destination storage bucket
+        source: Object key/path to copy from
+        destination: Object key/path to copy to
+        source_bucket: Bucket containing source, if different from bucket
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If source object doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> copy(
+        ...     bucket='analytics-data',
+        ...     source='staging/report.csv',
+        ...     destination='reports/2024-10/report.csv'
+        ... )
+
+    Note:
+        An existing destination object is overwritten without warning.
     """
+    if _use_local():
+        return _local.copy(bucket, source, destination, source_bucket)
     raise NotImplementedError(
         "This function is transformed at deployment time. "
         "For local development, set INFRAR_PROVIDER environment variable "
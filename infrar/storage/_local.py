@@ -0,0 +1,148 @@
+"""
+Local filesystem backend for infrar.storage.
+
+Used in local development when the INFRAR_PROVIDER environment variable is set to
+"local". Buckets are directories under INFRAR_LOCAL_ROOT (defaults to an
+"infrar-storage" directory in the system temp dir) and object keys are relative
+paths inside them.
+
+This module is never part of transformed code; it only exists so that code written
+against infrar.storage can be run and tested without a cloud account.
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+def _root() -> Path:
+    return Path(os.environ.get("INFRAR_LOCAL_ROOT", Path(tempfile.gettempdir(), "infrar-storage")))
+
+
+def _bucket_path(bucket: str, key: str = "") -> Path:
+    """Resolve key inside bucket, refusing anything that escapes the bucket directory."""
+    root = _root().resolve()
+    bucket_root = (root / bucket).resolve()
+    path = (bucket_root / key).resolve()
+    if root not in bucket_root.parents or (path != bucket_root and bucket_root not in path.parents):
+        raise ValueError(f"Key {key!r} in bucket {bucket!r} resolves outside the storage root")
+    return path
+
+
+def _object_path(bucket: str, key: str) -> Path:
+    path = _bucket_path(bucket, key)
+    if path == _bucket_path(bucket):
+        raise ValueError(f"Invalid object key {key!r}")
+    return path
+
+
+def _copy_file(source: str, destination: str) -> None:
+    """Copy a file without passing its contents through user space where possible."""
+    # Opening the destination for writing would truncate the source if they are
+    # the same file, so refuse up front the way shutil.copyfile() does
+    try:
+        same_file = os.path.samefile(source, destination)
+    except FileNotFoundError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    if hasattr(os, "copy_file_range") and _copy_file_range(source, destination):
+        return
+    # shutil.copyfile() uses sendfile() on Linux and fcopyfile() on macOS
+    shutil.copyfile(source, destination)
+
+
+def _copy_file_range(source: str, destination: str) -> bool:
+    """Copy with copy_file_range(); return False if the copy is unsupported or incomplete."""
+    with open(source, "rb") as src:
+        remaining = os.fstat(src.fileno()).st_size
+        # procfs/sysfs and some FUSE files report size 0 even though they have content
+        if remaining == 0:
+            return False
+        with open(destination, "wb") as dst:
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        return False
+                    remaining -= copied
+            except OSError:
+                # Cross-device copies before Linux 5.3, or unsupported filesystems
+                return False
+    return True
+
+
+def upload(bucket: str, source: str, destination: str) -> None:
+    target = _object_path(bucket, destination)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _copy_file(source, str(target))
+
+
+def download(bucket: str, source: str, destination: str) -> None:
+    _copy_file(str(_object_path(bucket, source)), destination)
+
+
+def delete(bucket: str, path: str) -> None:
+    try:
+        _object_path(bucket, path).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def copy(bucket: str, source: str, destination: str, source_bucket: Optional[str] = None) -> None:
+    target = _object_path(bucket, destination)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _copy_file(str(_object_path(source_bucket or bucket, source)), str(target))
+
+
+def _iter_keys(directory: Path, key_prefix: str) -> Iterator[str]:
+    """Yield keys under directory in UTF-8 binary order, as S3 and GCS list them."""
+    try:
+        with os.scandir(directory) as it:
+            # A directory's keys all start with "name/", so sort it under that name
+            entries = [(e.name + "/" if e.is_dir() else e.name, e.is_dir()) for e in it]
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for name, is_dir in sorted(entries):
+        if is_dir:
+            yield from _iter_keys(directory / name, key_prefix + name)
+        else:
+            yield key_prefix + name
+
+
+def iter_objects(bucket: str, prefix: str = "", delimiter: Optional[str] = None) -> Iterator[str]:
+    # Only walk the directory the prefix points into, not the whole bucket
+    start_key = prefix.rpartition("/")[0]
+    start = _bucket_path(bucket, start_key)
+    seen = set()
+    for key in _iter_keys(start, start_key + "/" if start_key else ""):
+        if not key.startswith(prefix):
+            continue
+        if delimiter is None:
+            yield key
+            continue
+        end = key.find(delimiter, len(prefix))
+        if end == -1:
+            continue
+        common_prefix = key[: end + len(delimiter)]
+        if common_prefix not in seen:
+            seen.add(common_prefix)
+            yield common_prefix
+
+
+def upload_many(bucket: str, items: List[Tuple[str, str]], max_concurrency: int) -> None:
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        list(pool.map(lambda item: upload(bucket, *item), items))
+
+
+def download_many(bucket: str, items: List[Tuple[str, str]], max_concurrency: int) -> None:
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        list(pool.map(lambda item: download(bucket, *item), items))
+
+
+def delete_many(bucket: str, paths: Iterable[str]) -> None:
+    for path in paths:
+        delete(bucket, path)
@@ -0,0 +1,349 @@
+"""
+Asynchronous object storage operations for Infrar.
+
+This module mirrors infrar.storage with coroutine functions, for code that runs
+in an asyncio event loop. One event loop can drive many concurrent requests
+without a thread per transfer.
+
+Supported Providers:
+    - AWS S3 (aioboto3)
+    - GCP Cloud Storage (gcloud.aio.storage)
+    - Azure Blob Storage (azure.storage.blob.aio, coming soon)
+
+Operations:
+    - upload: Upload a file to object storage
+    - download: Download a file from object storage
+    - delete: Delete an object from storage
+    - delete_many: Delete several objects in batched requests
+    - copy: Copy an object within or between buckets, server-side
+    - list_objects: List objects in a bucket with optional prefix
+    - iter_objects: Stream objects in a bucket with optional prefix
+
+Example:
+    >>> import asyncio
+    >>> from infrar.storage import MAX_CONCURRENCY
+    >>> from infrar.storage.aio import upload
+    >>>
+    >>> async def upload_all(bucket, items):
+    ...     limit = asyncio.Semaphore(MAX_CONCURRENCY)
+    ...
+    ...     async def upload_one(source, destination):
+    ...         async with limit:
+    ...             await upload(bucket=bucket, source=source, destination=destination)
+    ...
+    ...     await asyncio.gather(*(upload_one(s, d) for s, d in items))
+
+Note:
+    Like infrar.storage, these functions are stubs that are transformed away at
+    deployment time. Generated code must share one async client per event loop,
+    created with AioConfig(max_pool_connections=64), following the same
+    client-reuse contract as the synchronous module.
+"""
+
+import asyncio
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional
+
+from infrar.storage import _local, _use_local
+
+__all__ = [
+    "upload",
+    "download",
+    "delete",
+    "delete_many",
+    "copy",
+    "list_objects",
+    "iter_objects",
+]
+
+# Keys fetched per executor call when listing from the local backend
+_LOCAL_PAGE_SIZE = 1000
+
+
+async def _run_local(func: Callable[..., None], *args: Any) -> None:
+    """Run a blocking local backend call without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def upload(bucket: str, source: str, destination: str) -> None:
+    """
+    Upload a file to object storage.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').upload_file()
+        - GCP: gcloud.aio.storage.Storage().upload_from_filename()
+        - Azure: azure.storage.blob.aio.BlobClient().upload_blob()
+
+    Args:
+        bucket: Name of the storage bucket
+        source: Local file path to upload
+        destination: Destination path/key in the bucket
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If source file doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> await upload(
+        ...     bucket='analytics-data',
+        ...     source='/tmp/report.csv',
+        ...     destination='reports/2024-10/report.csv'
+        ... )
+
+    Note:
+        Large files follow the same multipart rules as infrar.storage.upload().
+    """
+    if _use_local():
+        return await _run_local(_local.upload, bucket, source, destination)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def download(bucket: str, source: str, destination: str) -> None:
+    """
+    Download a file from object storage.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').download_file()
+        - GCP: gcloud.aio.storage.Storage().download_to_filename()
+        - Azure: azure.storage.blob.aio.BlobClient().download_blob()
+
+    Args:
+        bucket: Name of the storage bucket
+        source: Object key/path in the bucket to download
+        destination: Local file path where the file will be saved
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If object doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> await download(
+        ...     bucket='analytics-data',
+        ...     source='reports/2024-10/report.csv',
+        ...     destination='/tmp/downloaded-report.csv'
+        ... )
+
+    Note:
+        The destination directory must exist. The function will overwrite
+        existing files without warning.
+    """
+    if _use_local():
+        return await _run_local(_local.download, bucket, source, destination)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def delete(bucket: str, path: str) -> None:
+    """
+    Delete an object from storage.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').delete_object()
+        - GCP: gcloud.aio.storage.Storage().delete()
+        - Azure: azure.storage.blob.aio.BlobClient().delete_blob()
+
+    Args:
+        bucket: Name of the storage bucket
+        path: Object key/path to delete
+
+    Returns:
+        None
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> await delete(bucket='temporary-data', path='temp/processing-file.csv')
+
+    Note:
+        This operation is idempotent - deleting a non-existent object
+        typically doesn't raise an error on most cloud providers.
+    """
+    if _use_local():
+        return await _run_local(_local.delete, bucket, path)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def delete_many(bucket: str, paths: Iterable[str]) -> None:
+    """
+    Delete several objects from storage in batched requests.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').delete_objects() in batches of 1000 keys
+        - GCP: gcloud.aio.storage.Storage().delete() gathered per batch
+        - Azure: azure.storage.blob.aio.ContainerClient().delete_blobs()
+
+    Args:
+        bucket: Name of the storage bucket
+        paths: Object keys/paths to delete
+
+    Returns:
+        None
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> await delete_many(
+        ...     bucket='temporary-data',
+        ...     paths=await list_objects(bucket='temporary-data', prefix='temp/')
+        ... )
+    """
+    if _use_local():
+        return await _run_local(_local.delete_many, bucket, paths)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def copy(
+    bucket: str, source: str, destination: str, source_bucket: Optional[str] = None
+) -> None:
+    """
+    Copy an object within storage, without downloading it.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').copy()
+        - GCP: gcloud.aio.storage.Storage().copy()
+        - Azure: azure.storage.blob.aio.BlobClient().start_copy_from_url()
+
+    Args:
+        bucket: Name of the destination storage bucket
+        source: Object key/path to copy from
+        destination: Object key/path to copy to
+        source_bucket: Bucket containing source, if different from bucket
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If source object doesn't exist (in local dev mode)
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> await copy(
+        ...     bucket='analytics-data',
+        ...     source='staging/report.csv',
+        ...     destination='reports/2024-10/report.csv'
+        ... )
+    """
+    if _use_local():
+        return await _run_local(_local.copy, bucket, source, destination, source_bucket)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def list_objects(bucket: str, prefix: str = "", delimiter: Optional[str] = None) -> List[str]:
+    """
+    List objects in a bucket, optionally filtered by prefix.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').get_paginator('list_objects_v2')
+        - GCP: gcloud.aio.storage.Storage().list_objects()
+        - Azure: azure.storage.blob.aio.ContainerClient().list_blobs()
+
+    Args:
+        bucket: Name of the storage bucket
+        prefix: Optional prefix to filter objects (e.g., 'reports/2024/')
+        delimiter: Optional delimiter (usually '/'). When set, only the distinct
+            "directory" prefixes directly below prefix are returned, not objects
+
+    Returns:
+        List of object keys/paths in the bucket, or of common prefixes if
+        delimiter is set
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> reports = await list_objects(bucket='my-data', prefix='reports/')
+
+    Note:
+        The whole listing is held in memory. Use iter_objects() for large buckets.
+    """
+    return [key async for key in iter_objects(bucket=bucket, prefix=prefix, delimiter=delimiter)]
+
+
+def iter_objects(
+    bucket: str, prefix: str = "", delimiter: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Iterate asynchronously over objects in a bucket, optionally filtered by prefix.
+
+    Every page of the listing is followed and keys are yielded as pages arrive.
+
+    This function is transformed at deployment time to use the native async SDK
+    of your target cloud provider:
+        - AWS: aioboto3.Session().client('s3').get_paginator('list_objects_v2').paginate()
+        - GCP: gcloud.aio.storage.Storage().list_objects() following nextPageToken
+        - Azure: azure.storage.blob.aio.ContainerClient().list_blobs()
+
+    Args:
+        bucket: Name of the storage bucket
+        prefix: Optional prefix to filter objects (e.g., 'reports/2024/')
+        delimiter: Optional delimiter (usually '/'). When set, only the distinct
+            "directory" prefixes directly below prefix are yielded, not objects
+
+    Returns:
+        Async iterator over object keys/paths in the bucket, or over common
+        prefixes if delimiter is set
+
+    Raises:
+        PermissionError: If insufficient permissions (in local dev mode)
+
+    Example:
+        >>> async for key in iter_objects(bucket='my-data', prefix='reports/'):
+        ...     print(key)
+    """
+    if _use_local():
+        return _iter_local(bucket, prefix, delimiter)
+    raise NotImplementedError(
+        "This function is transformed at deployment time. "
+        "For local development, set INFRAR_PROVIDER environment variable "
+        "or install provider-specific extras: pip install infrar[aws]"
+    )
+
+
+async def _iter_local(bucket: str, prefix: str, delimiter: Optional[str]) -> AsyncIterator[str]:
+    # Walk the filesystem in the executor a page at a time, like a paginated
+    # listing, so the event loop is never blocked on directory scans
+    loop = asyncio.get_running_loop()
+    keys = _local.iter_objects(bucket, prefix, delimiter)
+    while True:
+        page = await loop.run_in_executor(None, _next_page, keys)
+        if not page:
+            return
+        for key in page:
+            yield key
+
+
+def _next_page(keys: Iterator[str]) -> List[str]:
+    return list(islice(keys, _LOCAL_PAGE_SIZE))
@@ -0,0 +1,12 @@
+"""Shared fixtures for infrar tests."""
+
+import pytest
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    """Serve infrar.storage from a temporary directory."""
+    root = tmp_path / "storage"
+    monkeypatch.setenv("INFRAR_PROVIDER", "local")
+    monkeypatch.setenv("INFRAR_LOCAL_ROOT", str(root))
+    return root
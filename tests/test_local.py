@@ -0,0 +1,205 @@
+"""Tests for the local filesystem backend of infrar.storage."""
+
+import os
+import shutil
+
+import pytest
+from infrar.storage import (
+    upload,
+    download,
+    delete,
+    list_objects,
+    iter_objects,
+    upload_many,
+    download_many,
+    delete_many,
+    copy,
+)
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """A small local file to upload."""
+    path = tmp_path / "report.csv"
+    path.write_text("id,value\n1,a\n2,b\n")
+    return path
+
+
+class TestLocalTransfers:
+    """Test upload and download against the local backend."""
+
+    def test_upload_creates_object(self, local_storage, source_file):
+        """Test that upload copies the file under bucket/key."""
+        upload(bucket="data", source=str(source_file), destination="reports/2024/report.csv")
+
+        stored = local_storage / "data" / "reports" / "2024" / "report.csv"
+        assert stored.read_text() == source_file.read_text()
+
+    def test_upload_overwrites_existing_object(self, local_storage, source_file, tmp_path):
+        """Test that uploading to an existing key replaces its contents."""
+        upload(bucket="data", source=str(source_file), destination="report.csv")
+        smaller = tmp_path / "smaller.csv"
+        smaller.write_text("id\n")
+        upload(bucket="data", source=str(smaller), destination="report.csv")
+
+        assert (local_storage / "data" / "report.csv").read_text() == "id\n"
+
+    def test_upload_missing_source(self, local_storage, tmp_path):
+        """Test that uploading a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            upload(bucket="data", source=str(tmp_path / "missing.csv"), destination="x.csv")
+
+    def test_download_roundtrip(self, local_storage, source_file, tmp_path):
+        """Test that a downloaded object matches the uploaded file."""
+        upload(bucket="data", source=str(source_file), destination="report.csv")
+        target = tmp_path / "downloaded.csv"
+        download(bucket="data", source="report.csv", destination=str(target))
+
+        assert target.read_text() == source_file.read_text()
+
+    def test_download_missing_object(self, local_storage, tmp_path):
+        """Test that downloading a missing object raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            download(bucket="data", source="missing.csv", destination=str(tmp_path / "x.csv"))
+
+    def test_copy_within_and_between_buckets(self, local_storage, source_file):
+        """Test server-side copy in the same bucket and from another bucket."""
+        upload(bucket="staging", source=str(source_file), destination="report.csv")
+        copy(bucket="staging", source="report.csv", destination="copies/report.csv")
+        copy(bucket="data", source="report.csv", destination="report.csv", source_bucket="staging")
+
+        assert (local_storage / "staging" / "copies" / "report.csv").exists()
+        assert (local_storage / "data" / "report.csv").read_text() == source_file.read_text()
+
+    def test_copy_missing_object(self, local_storage):
+        """Test that copying a missing object raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            copy(bucket="data", source="missing.csv", destination="x.csv")
+
+    def test_copy_onto_itself(self, local_storage, source_file):
+        """Test that copying an object onto itself raises and keeps its contents."""
+        upload(bucket="data", source=str(source_file), destination="report.csv")
+        with pytest.raises(shutil.SameFileError):
+            copy(bucket="data", source="report.csv", destination="report.csv")
+
+        assert (local_storage / "data" / "report.csv").read_text() == source_file.read_text()
+
+    def test_upload_short_copy_falls_back(self, local_storage, source_file, monkeypatch):
+        """Test that a copy_file_range() that stops early doesn't leave a short object."""
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        upload(bucket="data", source=str(source_file), destination="report.csv")
+
+        assert (local_storage / "data" / "report.csv").read_text() == source_file.read_text()
+
+    @pytest.mark.skipif(not os.path.exists("/proc/cpuinfo"), reason="requires procfs")
+    def test_upload_file_reporting_zero_size(self, local_storage):
+        """Test that files reporting st_size 0 but having content are copied in full."""
+        upload(bucket="data", source="/proc/cpuinfo", destination="cpuinfo.txt")
+
+        assert (local_storage / "data" / "cpuinfo.txt").stat().st_size > 0
+
+    def test_upload_many_and_download_many(self, local_storage, source_file, tmp_path):
+        """Test batched transfers in both directions."""
+        upload_many(
+            bucket="data",
+            items=[(str(source_file), "a.csv"), (str(source_file), "nested/b.csv")],
+        )
+        download_many(
+            bucket="data",
+            items=[("a.csv", str(tmp_path / "a.csv")), ("nested/b.csv", str(tmp_path / "b.csv"))],
+            max_concurrency=2,
+        )
+
+        assert (tmp_path / "a.csv").read_text() == source_file.read_text()
+        assert (tmp_path / "b.csv").read_text() == source_file.read_text()
+
+
+class TestLocalKeyValidation:
+    """Test that keys can't reach outside the local storage root."""
+
+    def test_absolute_key_rejected(self, local_storage, tmp_path):
+        """Test that a key with a leading '/' can't delete files outside the bucket."""
+        victim = tmp_path / "victim.txt"
+        victim.write_text("keep me")
+
+        with pytest.raises(ValueError):
+            delete(bucket="data", path=str(victim))
+        assert victim.read_text() == "keep me"
+
+    def test_parent_key_rejected(self, local_storage, source_file, tmp_path):
+        """Test that '..' keys can't write outside the storage root."""
+        with pytest.raises(ValueError):
+            upload(bucket="data", source=str(source_file), destination="../../outside.txt")
+        assert not (tmp_path / "outside.txt").exists()
+
+    def test_parent_bucket_rejected(self, local_storage, source_file):
+        """Test that a '..' bucket name can't escape the storage root."""
+        with pytest.raises(ValueError):
+            upload(bucket="..", source=str(source_file), destination="outside.txt")
+
+    def test_parent_prefix_rejected(self, local_storage):
+        """Test that listing can't walk outside the bucket."""
+        with pytest.raises(ValueError):
+            list_objects(bucket="data", prefix="../../")
+
+    def test_dot_segments_inside_bucket_allowed(self, local_storage, source_file):
+        """Test that '..' segments which stay inside the bucket still work."""
+        upload(bucket="data", source=str(source_file), destination="a/../report.csv")
+        assert (local_storage / "data" / "report.csv").exists()
+
+
+class TestLocalListing:
+    """Test listing and deletion against the local backend."""
+
+    @pytest.fixture(autouse=True)
+    def populate(self, local_storage, source_file):
+        """Store a few objects in the 'data' bucket."""
+        for key in ["file1.txt", "reports/2023/r1.csv", "reports/2024/r2.csv", "reports/r3.csv"]:
+            upload(bucket="data", source=str(source_file), destination=key)
+
+    def test_list_all_objects(self):
+        """Test listing every object in the bucket."""
+        assert sorted(list_objects(bucket="data")) == [
+            "file1.txt",
+            "reports/2023/r1.csv",
+            "reports/2024/r2.csv",
+            "reports/r3.csv",
+        ]
+
+    def test_list_with_prefix(self):
+        """Test that only keys under the prefix are returned."""
+        assert sorted(iter_objects(bucket="data", prefix="reports/20")) == [
+            "reports/2023/r1.csv",
+            "reports/2024/r2.csv",
+        ]
+
+    def test_list_with_delimiter(self):
+        """Test that a delimiter returns common prefixes only."""
+        assert sorted(iter_objects(bucket="data", prefix="reports/", delimiter="/")) == [
+            "reports/2023/",
+            "reports/2024/",
+        ]
+
+    def test_list_in_binary_key_order(self, source_file):
+        """Test that keys come back in S3's UTF-8 binary order, not directory-walk order."""
+        for key in ["b", "a/x", "a.txt", "a0"]:
+            upload(bucket="order", source=str(source_file), destination=key)
+
+        assert list_objects(bucket="order") == ["a.txt", "a/x", "a0", "b"]
+
+    def test_list_missing_bucket(self):
+        """Test that listing an unknown bucket yields nothing."""
+        assert list_objects(bucket="missing") == []
+
+    def test_delete_is_idempotent(self):
+        """Test that deleting twice doesn't raise."""
+        delete(bucket="data", path="file1.txt")
+        delete(bucket="data", path="file1.txt")
+
+        assert "file1.txt" not in list_objects(bucket="data")
+
+    def test_delete_many(self):
+        """Test batched deletion from an iterator of keys."""
+        delete_many(bucket="data", paths=list(iter_objects(bucket="data", prefix="reports/")))
+
+        assert list_objects(bucket="data") == ["file1.txt"]
@@ -1,7 +1,20 @@
 """Tests for infrar.storage module."""
 
+import ast
+import textwrap
+
 import pytest
-from infrar.storage import upload, download, delete, list_objects
+from infrar.storage import (
+    upload,
+    download,
+    delete,
+    list_objects,
+    iter_objects,
+    upload_many,
+    download_many,
+    delete_many,
+    copy,
+)
 
 
 class TestStorageImports:
@@ -38,6 +51,11 @@ class TestStorageImports:
         assert "download" in infrar.storage.__all__
         assert "delete" in infrar.storage.__all__
         assert "list_objects" in infrar.storage.__all__
+        assert "iter_objects" in infrar.storage.__all__
+        assert "upload_many" in infrar.storage.__all__
+        assert "download_many" in infrar.storage.__all__
+        assert "delete_many" in infrar.storage.__all__
+        assert "copy" in infrar.storage.__all__
 
 
 class TestStorageFunctions:
@@ -70,6 +88,112 @@ class TestStorageFunctions:
         with pytest.raises(NotImplementedError):
             list_objects(bucket="test", prefix="folder/")
 
+    def test_iter_objects_signature(self):
+        """Test iter_objects raises on call, not on first iteration."""
+        with pytest.raises(NotImplementedError):
+            iter_objects(bucket="test", prefix="folder/")
+
+    def test_list_objects_with_delimiter(self):
+        """Test list_objects and iter_objects with optional delimiter parameter."""
+        with pytest.raises(NotImplementedError):
+            list_objects(bucket="test", prefix="folder/", delimiter="/")
+        with pytest.raises(NotImplementedError):
+            iter_objects(bucket="test", prefix="folder/", delimiter="/")
+
+    def test_upload_many_signature(self):
+        """Test upload_many function signature."""
+        with pytest.raises(NotImplementedError):
+            upload_many(bucket="test", items=[("a.txt", "dest/a.txt"), ("b.txt", "dest/b.txt")])
+
+    def test_download_many_signature(self):
+        """Test download_many with optional max_concurrency parameter."""
+        with pytest.raises(NotImplementedError):
+            download_many(bucket="test", items=[("dest/a.txt", "a.txt")], max_concurrency=4)
+
+    def test_delete_many_signature(self):
+        """Test delete_many accepts any iterable of paths."""
+        with pytest.raises(NotImplementedError):
+            delete_many(bucket="test", paths=iter(["a.txt", "b.txt"]))
+
+    def test_copy_signature(self):
+        """Test copy with optional source_bucket parameter."""
+        with pytest.raises(NotImplementedError):
+            copy(bucket="test", source="a.txt", destination="b.txt")
+        with pytest.raises(NotImplementedError):
+            copy(bucket="test", source="a.txt", destination="b.txt", source_bucket="other")
+
+
+class TestTransferConfiguration:
+    """Test transfer tuning constants read by the transformer."""
+
+    def test_multipart_defaults(self):
+        """Test multipart threshold, chunk size and concurrency defaults."""
+        import infrar.storage
+
+        assert infrar.storage.MULTIPART_THRESHOLD == 8 * 1024 * 1024
+        assert infrar.storage.MULTIPART_CHUNKSIZE == 8 * 1024 * 1024
+        assert infrar.storage.MAX_CONCURRENCY == 16
+
+    def test_upload_documents_multipart(self):
+        """Test that upload/download document the multipart knobs."""
+        for func in [upload, download]:
+            assert "MULTIPART_THRESHOLD" in func.__doc__
+            assert "MAX_CONCURRENCY" in func.__doc__
+
+    def test_upload_documents_transformer_contract(self):
+        """Test that upload documents the sliding-window part scheduling contract."""
+        assert "Transformer Contract:" in upload.__doc__
+        assert "sliding window" in upload.__doc__
+
+    def test_upload_documents_retry_contract(self):
+        """Test that upload documents per-part retries and aborting failed uploads."""
+        assert "UploadId" in upload.__doc__
+        assert "abort_multipart_upload" in upload.__doc__
+
+    def test_module_documents_client_reuse(self):
+        """Test that the module documents reusing a single provider client."""
+        import infrar.storage
+
+        assert "Transformer Contract:" in infrar.storage.__doc__
+        assert "max_pool_connections" in infrar.storage.__doc__
+        assert "region_name=_REGION" in infrar.storage.__doc__
+
+
+class TestListingContract:
+    """Lint the reference AWS lowering documented for object listing."""
+
+    @staticmethod
+    def _reference_lowering():
+        """Parse the code block following 'Reference AWS lowering:' in iter_objects."""
+        lines = iter_objects.__doc__.split("Reference AWS lowering:", 1)[1].splitlines()[2:]
+        block = []
+        for line in lines:
+            if line.strip() and not line.startswith(" " * 12):
+                break
+            block.append(line)
+        body = textwrap.indent(textwrap.dedent("\n".join(block)), "    ")
+        return ast.parse(f"def lowered(s3, bucket, prefix):\n{body}")
+
+    @staticmethod
+    def _called_methods(tree):
+        return {
+            node.func.attr
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+        }
+
+    def test_lowering_uses_paginator(self):
+        """Test that the AWS lowering goes through get_paginator."""
+        methods = self._called_methods(self._reference_lowering())
+        assert "get_paginator" in methods
+        assert "paginate" in methods
+
+    def test_lowering_never_calls_list_objects_v2_directly(self):
+        """Test that the AWS lowering never issues a single-shot listing call."""
+        methods = self._called_methods(self._reference_lowering())
+        assert "list_objects_v2" not in methods
+        assert "list_objects" not in methods
+
 
 class TestStorageDocumentation:
     """Test documentation quality."""
@@ -91,7 +215,17 @@ class TestStorageDocumentation:
 
     def test_functions_list_providers(self):
         """Test that functions list supported providers."""
-        for func in [upload, download, delete, list_objects]:
+        for func in [
+            upload,
+            download,
+            delete,
+            list_objects,
+            iter_objects,
+            upload_many,
+            download_many,
+            delete_many,
+            copy,
+        ]:
             docstring = func.__doc__.lower()
             assert "aws" in docstring or "s3" in docstring
             assert "gcp" in docstring or "cloud storage" in docstring